@@ -0,0 +1,98 @@
+"""
+Startup Time Benchmark.
+
+This module measures the cold-start latency of the program, i.e. the time needed
+by a fresh interpreter to import `main`, and fails if it exceeds a limit. It also
+checks that importing `main` does not load `telethon` or build the Telegram
+client, which must only happen on first use.
+
+Run it from the root of the repository:
+
+    python benchmarks/startup.py --runs 20 --max-ms 300
+
+Modules:
+    - argparse: Parses the command line options.
+    - statistics: Computes the median of the measured times.
+    - subprocess: Starts a fresh interpreter for every run.
+    - sys: Provides the current interpreter and the exit code.
+    - time: Measures the elapsed time.
+
+Functions:
+    - measure_startup: Measures the import time of `main` in fresh interpreters.
+    - main: Runs the benchmark and reports the result.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Imports `main` and checks that nothing heavy was initialized
+STARTUP_CODE = """
+import sys
+sys.path.insert(0, 'src')
+import main
+import downloader
+assert 'telethon' not in sys.modules, 'telethon imported at startup'
+assert downloader.client is None, 'Telegram client built at startup'
+"""
+
+
+def measure_startup(runs):
+    """
+    Measure the time needed to import `main` in fresh interpreters.
+
+    Args:
+        runs (int): Number of interpreters to start.
+
+    Returns:
+        list: Elapsed time of every run, in milliseconds.
+
+    Raises:
+        RuntimeError: If a run fails, including the lazy initialization checks.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', STARTUP_CODE],
+                                capture_output=True, text=True, check=False)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+        times.append(elapsed)
+    return times
+
+
+def main():
+    """
+    Run the startup benchmark and compare the median time with the limit.
+
+    Returns:
+        int: 0 if the median startup time is within the limit, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Measure cold-start latency.")
+    parser.add_argument('--runs', type=int, default=10,
+                        help="number of fresh interpreters to start")
+    parser.add_argument('--max-ms', type=float, default=300,
+                        help="maximum median startup time in milliseconds")
+    args = parser.parse_args()
+
+    try:
+        times = measure_startup(args.runs)
+    except RuntimeError as e:
+        print(f"- Error: Startup failed: {e}")
+        return 1
+
+    median = statistics.median(times)
+    print(f"Startup time over {args.runs} runs: median {median:.1f} ms, "
+          f"min {min(times):.1f} ms, max {max(times):.1f} ms")
+
+    if median > args.max_ms:
+        print(f"- Error: Median startup time exceeds {args.max_ms:.0f} ms.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
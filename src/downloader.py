@@ -10,7 +10,6 @@ directory creation, and filtering messages based on specified restrictions.
 import os
 import re
 from datetime import datetime, timedelta
-from telethon.sync import TelegramClient
 from logger_config import setup_logging
 from user_input import select_download_mode
 from file_loader import read_json_config
@@ -18,10 +17,45 @@ from file_loader import read_json_config
 # Configure logging
 logging = setup_logging()
 
-# Set up Telegram API credentials
-api_id = os.getenv('API_ID')
-api_hash = os.getenv('API_HASH')
-client = TelegramClient('group_media_downloader', api_id, api_hash)
+SESSION_NAME = 'group_media_downloader'
+
+
+def create_client(session_name=SESSION_NAME):
+    """
+    Build a Telegram client for a session using the API credentials from the environment.
+
+    `telethon` is imported here rather than at module level, so importing this
+    module stays cheap and the credentials are read after `.env` is loaded.
+
+    Args:
+        session_name (str): Name of the session file used by the client.
+
+    Returns:
+        TelegramClient: The (not yet connected) Telegram client.
+    """
+    from telethon.sync import TelegramClient
+
+    api_id = os.getenv('API_ID')
+    api_hash = os.getenv('API_HASH')
+    return TelegramClient(session_name, api_id, api_hash)
+
+
+# Built on first use by `get_client`
+client = None
+
+
+def get_client():
+    """
+    Return the Telegram client of the process, building it on first use.
+
+    Returns:
+        TelegramClient: The Telegram client of the default session, or the one
+                        set by a worker of the sharded download.
+    """
+    global client
+    if client is None:
+        client = create_client()
+    return client
 
 
 def __clean_folder_name(folder_name):
@@ -60,24 +94,30 @@ def __is_valid_description(message, restrictions):
     return True
 
 
-async def __save_media(message, save_path):
+async def __save_media(message, save_path, manifest=None):
     """
     Download media content from a Telegram message.
 
     Args:
         message (telethon.tl.custom.Message): The Telegram message containing media.
         save_path (str): Directory to save the downloaded media.
+        manifest (DownloadManifest, optional): Record of already downloaded messages.
 
     Returns:
         int: 1 if the media was downloaded successfully, 0 otherwise.
     """
     logging.debug("Trying download message: %d, Save path: %s",
                   message.id, save_path)
+    if manifest is not None and manifest.contains(message.id):
+        logging.debug("--- Skipped message %d, already downloaded", message.id)
+        return 0
     try:
         if message.media is not None and hasattr(message.media, 'photo'):
-            await client.download_media(message.media, file=save_path)
+            await get_client().download_media(message.media, file=save_path)
             logging.debug(
                 "--- Downloaded message %d, Save path: %s", message.id, save_path)
+            if manifest is not None:
+                manifest.add(message.id)
             return 1
     except Exception as e:
         logging.error(
@@ -85,7 +125,7 @@ async def __save_media(message, save_path):
     return 0
 
 
-async def __process_general_download(entity, current_date, next_date, day_folder):
+async def __process_general_download(entity, current_date, next_date, day_folder, manifest=None):
     """
     Download all media from a Telegram group for a specific date.
 
@@ -94,24 +134,25 @@ async def __process_general_download(entity, current_date, next_date, day_folder
         current_date (datetime): The start date of the download range.
         next_date (datetime): The end date (exclusive) of the download range.
         day_folder (str): Directory to save the downloaded media for the day.
+        manifest (DownloadManifest, optional): Record of already downloaded messages.
 
     Returns:
         int: Total number of media files downloaded for the day.
     """
     day_count = 0
 
-    async for message in client.iter_messages(entity, offset_date=current_date, reverse=True):
+    async for message in get_client().iter_messages(entity, offset_date=current_date, reverse=True):
         if message.date.replace(tzinfo=None) < next_date:
             logging.debug("Message: id: %s, date: %s, message: %s, media: %s",
                           message.id, message.date, message.message, message.media)
-            day_count += await __save_media(message, save_path=day_folder)
+            day_count += await __save_media(message, save_path=day_folder, manifest=manifest)
         else:
             break
 
     return day_count
 
 
-async def __process_theme_grouped_download(entity, current_date, date_str, next_date, day_folder, restrictions):
+async def __process_theme_grouped_download(entity, current_date, date_str, next_date, day_folder, restrictions, manifest=None):
     """
     Download media grouped by themes for a specific date.
 
@@ -122,6 +163,7 @@ async def __process_theme_grouped_download(entity, current_date, date_str, next_
         next_date (datetime): The end date (exclusive) of the download range.
         day_folder (str): Directory to save the grouped media for the day.
         restrictions (list): Criteria for grouping and filtering messages.
+        manifest (DownloadManifest, optional): Record of already downloaded messages.
 
     Returns:
         int: Total number of media files downloaded for the day.
@@ -132,7 +174,7 @@ async def __process_theme_grouped_download(entity, current_date, date_str, next_
     photo_group = []
     description_message: str = None
 
-    async for message in client.iter_messages(entity, offset_date=current_date, reverse=True):
+    async for message in get_client().iter_messages(entity, offset_date=current_date, reverse=True):
         # Process messages only current date
         if message.date.replace(tzinfo=None) < next_date:
             logging.debug("Message: id: %s, date: %s, message: %s, media: %s",
@@ -165,7 +207,7 @@ async def __process_theme_grouped_download(entity, current_date, date_str, next_
                 logging.debug("--- Download photos of group: %s",
                               description_message)
                 for photo_message in photo_group:
-                    day_count += await __save_media(photo_message, save_path=group_folder_path)
+                    day_count += await __save_media(photo_message, save_path=group_folder_path, manifest=manifest)
                 logging.debug("--- End of group: %s", description_message)
 
                 logging.debug("Create new empty group")
@@ -177,6 +219,141 @@ async def __process_theme_grouped_download(entity, current_date, date_str, next_
     return day_count
 
 
+def build_base_dir(group_name, start_date_obj, end_date_obj, base_path, with_today=True):
+    """
+    Create the base directory of a download.
+
+    Args:
+        group_name (str): Name of the Telegram group or channel.
+        start_date_obj (datetime): Start date for media download.
+        end_date_obj (datetime): End date for media download.
+        base_path (str): Directory where media files will be saved.
+        with_today (bool): Whether to include the current date in the directory name.
+                           Without it, the same range always maps to the same
+                           directory, so a run restarted on another day can resume.
+
+    Returns:
+        str: Path of the created base directory.
+    """
+    today_str = f"-{datetime.now().strftime('%d-%m-%Y')}" if with_today else ""
+    name_dir = f"download-group-{group_name}{today_str}-s-{
+        start_date_obj.strftime('%d-%m-%Y')}-e-{end_date_obj.strftime('%d-%m-%Y')}"
+    base_dir = os.path.join(base_path, name_dir)
+    os.makedirs(base_dir, exist_ok=True)
+    logging.debug("Base dir. %s created in %s: %s",
+                  name_dir, base_path, base_dir)
+    return base_dir
+
+
+async def download_date_range(entity, start_date_obj, end_date_obj, base_dir, choose, restrictions, manifest=None, show_progress=True):
+    """
+    Download media of a Telegram entity day by day into month and day folders.
+
+    Args:
+        entity: The Telegram entity (group or channel) to download from.
+        start_date_obj (datetime): First day to download.
+        end_date_obj (datetime): Last day (inclusive) to download.
+        base_dir (str): Base directory of the download.
+        choose (int): Download mode (1: General, 2: Group by theme).
+        restrictions (list): Criteria for grouping and filtering messages.
+        manifest (DownloadManifest, optional): Record of already downloaded messages.
+        show_progress (bool): Whether to print the progress bar.
+
+    Returns:
+        int: Total number of media files downloaded for the range.
+    """
+    total_downloaded = 0
+    current_date = start_date_obj
+
+    # Progress bar init
+    total_days = (end_date_obj - start_date_obj).days + 1
+    completed_days = 0
+    if show_progress:
+        print("\nDownloading...", end=" ")
+
+    # Loop period
+    while current_date <= end_date_obj:
+        month_str = current_date.strftime('%m-%Y')
+        month_folder = os.path.join(base_dir, month_str)
+        if not os.path.exists(month_folder):
+            os.makedirs(month_folder, exist_ok=True)
+            logging.debug("Month dir. %s created in %s: %s",
+                          month_str, base_dir, month_folder)
+
+        date_str = current_date.strftime('%d-%m-%Y')
+        day_folder = os.path.join(month_folder, date_str)
+        os.makedirs(day_folder, exist_ok=True)
+        logging.debug("Day dir. %s created in %s: %s",
+                      date_str, month_folder, day_folder)
+
+        logging.info("Downloading media for day: %s", date_str)
+
+        match choose:
+            case 1:
+                day_count = await __process_general_download(entity, current_date, (current_date + timedelta(days=1)), day_folder, manifest)
+            case 2:
+                day_count = await __process_theme_grouped_download(entity, current_date, date_str, (current_date + timedelta(days=1)), day_folder, restrictions, manifest)
+
+        logging.info("--- Downloaded %d files for %s.",
+                     day_count, date_str)
+        # Folder may still hold files of a previous run recorded in the manifest
+        if day_count == 0 and not os.listdir(day_folder):
+            logging.info(
+                "No files downloaded for %s. Removing folder %s.", date_str, day_folder)
+            os.rmdir(day_folder)
+
+        total_downloaded += day_count
+        current_date += timedelta(days=1)
+
+        # Progress bar print
+        completed_days += 1
+        if show_progress:
+            progress_percentage = int((completed_days / total_days) * 100)
+            bar = f"[{'#' * (progress_percentage // 2)}{'-' * (50 -
+                                                               (progress_percentage // 2))}] {progress_percentage}%"
+            print(f"\r{"Downloading..." if progress_percentage <
+                  100 else "Downloaded:"} {bar}", end='')
+
+    return total_downloaded
+
+
+async def download_shard(group_name, start_date_obj, end_date_obj, base_dir, choose, restrictions, manifest):
+    """
+    Download one shard of a sharded download with the current client.
+
+    Unlike `download_media_from_group`, this function never prompts: the session
+    must already be authorized and the download mode is given by the coordinator.
+
+    Args:
+        group_name (str): Name of the Telegram group or channel.
+        start_date_obj (datetime): First day of the shard.
+        end_date_obj (datetime): Last day (inclusive) of the shard.
+        base_dir (str): Base directory shared by all shards.
+        choose (int): Download mode (1: General, 2: Group by theme).
+        restrictions (list): Criteria for grouping and filtering messages.
+        manifest (DownloadManifest): Record of the messages downloaded by previous runs.
+
+    Returns:
+        int: Total number of media files downloaded for the shard.
+
+    Raises:
+        RuntimeError: If the session of the client is not authorized.
+    """
+    client = get_client()
+    try:
+        await client.connect()
+        if not await client.is_user_authorized():
+            raise RuntimeError("Session is not authorized")
+
+        entity = await client.get_entity(group_name)
+        logging.info("Shard %s - %s of entity %d, %s", start_date_obj.strftime('%d-%m-%Y'),
+                     end_date_obj.strftime('%d-%m-%Y'), entity.id, entity.title)
+
+        return await download_date_range(entity, start_date_obj, end_date_obj, base_dir, choose, restrictions, manifest, show_progress=False)
+    finally:
+        await client.disconnect()
+
+
 async def download_media_from_group(group_name, start_date_obj, end_date_obj, base_path):
     """
     Download all media from a Telegram group within a specified date range.
@@ -190,6 +367,7 @@ async def download_media_from_group(group_name, start_date_obj, end_date_obj, ba
     Returns:
         None
     """
+    client = get_client()
     try:
         await client.start()
 
@@ -198,17 +376,11 @@ async def download_media_from_group(group_name, start_date_obj, end_date_obj, ba
         logging.info("Entity to download %d, %s", entity.id, entity.title)
 
         # Create base directory
-        name_dir = f"download-group-{group_name}-{datetime.now().strftime('%d-%m-%Y')}-s-{
-            start_date_obj.strftime('%d-%m-%Y')}-e-{end_date_obj.strftime('%d-%m-%Y')}"
-        base_dir = os.path.join(base_path, name_dir)
-        os.makedirs(base_dir, exist_ok=True)
-        logging.debug("Base dir. %s created in %s: %s",
-                      name_dir, base_path, base_dir)
+        base_dir = build_base_dir(
+            group_name, start_date_obj, end_date_obj, base_path)
 
         # Choose type
         choose = select_download_mode()
-        total_downloaded = 0
-        current_date = start_date_obj
 
         # Load restrictions
         restrictions = read_json_config(
@@ -218,51 +390,7 @@ async def download_media_from_group(group_name, start_date_obj, end_date_obj, ba
             if choose == 2:
                 return None
 
-        # Progress bar init
-        total_days = (end_date_obj - start_date_obj).days + 1
-        completed_days = 0
-        print("\nDownloading...", end=" ")
-
-        # Loop period
-        while current_date <= end_date_obj:
-            month_str = current_date.strftime('%m-%Y')
-            month_folder = os.path.join(base_dir, month_str)
-            if not os.path.exists(month_folder):
-                os.makedirs(month_folder)
-                logging.debug("Month dir. %s created in %s: %s",
-                              month_str, base_dir, month_folder)
-
-            date_str = current_date.strftime('%d-%m-%Y')
-            day_folder = os.path.join(month_folder, date_str)
-            os.makedirs(day_folder, exist_ok=True)
-            logging.debug("Day dir. %s created in %s: %s",
-                          date_str, month_folder, day_folder)
-
-            logging.info("Downloading media for day: %s", date_str)
-
-            match choose:
-                case 1:
-                    day_count = await __process_general_download(entity, current_date, (current_date + timedelta(days=1)), day_folder)
-                case 2:
-                    day_count = await __process_theme_grouped_download(entity, current_date, date_str, (current_date + timedelta(days=1)), day_folder, restrictions)
-
-            logging.info("--- Downloaded %d files for %s.",
-                         day_count, date_str)
-            if day_count == 0:
-                logging.info(
-                    "No files downloaded for %s. Removing folder %s.", date_str, day_folder)
-                os.rmdir(day_folder)
-
-            total_downloaded += day_count
-            current_date += timedelta(days=1)
-
-            # Progress bar print
-            completed_days += 1
-            progress_percentage = int((completed_days / total_days) * 100)
-            bar = f"[{'#' * (progress_percentage // 2)}{'-' * (50 -
-                                                               (progress_percentage // 2))}] {progress_percentage}%"
-            print(f"\r{"Downloading..." if progress_percentage <
-                  100 else "Downloaded:"} {bar}", end='')
+        total_downloaded = await download_date_range(entity, start_date_obj, end_date_obj, base_dir, choose, restrictions)
 
         print(f"\n\nTotal media files downloaded: {total_downloaded}")
         logging.info("Total media files downloaded: %d", total_downloaded)
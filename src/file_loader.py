@@ -2,7 +2,8 @@
 Module to handle file operations for loading configurations.
 
 This module provides functionality to load and parse JSON files, enabling
-retrieval of specific elements based on user-defined keys.
+retrieval of specific elements based on user-defined keys. Each file is parsed
+only once per process and served from memory afterwards.
 
 Modules:
     - json: Parses JSON data.
@@ -16,12 +17,17 @@ from logger_config import setup_logging
 # Configure logging
 logging = setup_logging()
 
+# Parsed JSON files by path
+__cache = {}
+
+
 def read_json_config(path, root_element):
     """
     Load a specific element from a JSON configuration file.
 
     This function reads a JSON file from the provided path, parses its content,
-    and retrieves the value corresponding to the specified root element.
+    and retrieves the value corresponding to the specified root element. The parsed
+    content is cached, so the file is read from disk only on the first call.
 
     Args:
         path (str): The file path to the JSON configuration file.
@@ -35,11 +41,14 @@ def read_json_config(path, root_element):
     Logs:
         - Error: If the file is not found at the specified path.
     """
-    if not os.path.exists(path):
-        print(f"- Error: Configuration file not found at {path}")
-        logging.error("- Error: Configuration file not found at %s", path)
-        return None
-    
-    with open(path, 'r', encoding="utf-8") as file:
-        data = json.load(file)
+    data = __cache.get(path)
+    if data is None:
+        if not os.path.exists(path):
+            print(f"- Error: Configuration file not found at {path}")
+            logging.error("- Error: Configuration file not found at %s", path)
+            return None
+
+        with open(path, 'r', encoding="utf-8") as file:
+            data = json.load(file)
+        __cache[path] = data
     return data.get(root_element, [])
\ No newline at end of file
@@ -9,11 +9,17 @@ output, such as log levels and handlers, based on the desired environment.
 The logging configuration is read from the 'logging_config.ini' file, with the option
 to set the environment dynamically, either through a provided argument or by reading
 the value from an environment variable (`LOGGER_CONFIG` in the `.env` file).
+
+The configuration file is parsed only once per process and environment; later
+calls return the already configured logger.
 """
 
 import logging.config
 import os
 
+# Environments whose configuration has already been loaded
+__configured = set()
+
 
 def setup_logging(environment='prod'):
     """
@@ -23,7 +29,8 @@ def setup_logging(environment='prod'):
     and sets up logging accordingly. The configuration is customized for the 
     specified environment (e.g., 'dev' or 'prod'). The default environment is 'prod'.
     It also checks if the environment variable `LOGGER_CONFIG` is set in the `.env` file,
-    and uses it if available.
+    and uses it if available. The log directory and the configuration file are only
+    processed by the first call for an environment.
 
     Args:
         environment (str): The environment for the logging configuration (default is 'dev').
@@ -32,15 +39,17 @@ def setup_logging(environment='prod'):
         logging.Logger: The logger instance configured for the specified environment.
     """
 
-    log_dir = 'logs'
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-
     value: str = os.getenv('LOGGER_CONFIG')
     if value is not None:
         environment = value
 
-    logging.config.fileConfig('logging_config.ini',
-                              defaults={'env': environment})
+    if environment not in __configured:
+        log_dir = 'logs'
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+
+        logging.config.fileConfig('logging_config.ini',
+                                  defaults={'env': environment})
+        __configured.add(environment)
 
     return logging.getLogger(environment)
@@ -11,13 +11,19 @@ Modules:
     - logger_config: Sets up logging configuration for tracking application activity.
     - user_input: Handles user input for configuration or manual parameters.
     - downloader: Manages the actual downloading of media from the Telegram group.
+    - sharding: Splits the download between several sessions and worker processes.
 
 Functions:
     - main(): The main program loop that prompts the user for input and initiates the download process.
 """
 
 import asyncio
+import os
 from dotenv import load_dotenv
+
+# Load environment variables before the modules below read them
+load_dotenv()
+
 from logger_config import setup_logging
 from user_input import get_input_from_config, get_manual_input
 from downloader import download_media_from_group
@@ -25,8 +31,24 @@ from downloader import download_media_from_group
 # Configure logging
 logging = setup_logging()
 
-# Load environment variables
-load_dotenv()
+
+def __get_download_workers():
+    """
+    Read the number of download workers from the `DOWNLOAD_WORKERS` environment variable.
+
+    Returns:
+        int: Number of workers, 1 if the variable is not set or is not a positive number.
+    """
+    value = os.getenv('DOWNLOAD_WORKERS', '1')
+    try:
+        workers = int(value)
+        if workers >= 1:
+            return workers
+    except ValueError:
+        pass
+    print(f"- Error: Invalid DOWNLOAD_WORKERS '{value}'. Using 1 worker.")
+    logging.error("Invalid DOWNLOAD_WORKERS '%s'. Using 1 worker.", value)
+    return 1
 
 
 async def main():
@@ -41,11 +63,14 @@ async def main():
         1. Displays menu options for the user.
         2. Handles user input and validates the choice.
         3. Collects parameters via `load_config_input` or `manual_input`.
-        4. Calls `download_all_media` to perform the download.
+        4. Calls `download_all_media` to perform the download, or
+           `download_media_sharded` if `DOWNLOAD_WORKERS` is greater than 1.
 
     Raises:
         ValueError: If the user inputs an invalid option number.
     """
+    workers = __get_download_workers()
+
     while True:
         print("Choose an option:")
         print("1. Load configuration from file")
@@ -64,7 +89,13 @@ async def main():
         except ValueError:
             print("- Error: Please enter a valid number.")
 
-    await download_media_from_group(group_name, start_date_obj, end_date_obj, save_path)
+    if workers > 1:
+        # Multiprocessing machinery is only needed for sharded downloads
+        from sharding import download_media_sharded
+        download_media_sharded(group_name, start_date_obj,
+                               end_date_obj, save_path, workers)
+    else:
+        await download_media_from_group(group_name, start_date_obj, end_date_obj, save_path)
 
 if __name__ == "__main__":
     logging.info("Running Telegram Group Media Downloader")
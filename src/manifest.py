@@ -0,0 +1,108 @@
+"""
+Module for tracking already downloaded messages of a download directory.
+
+This module provides the `DownloadManifest` class, a small append-only record
+of the message IDs that have been downloaded into a base directory. It lets an
+interrupted sharded download be resumed without downloading the same media
+again. It does not coordinate running workers: the shards of a download never
+overlap, so workers never compete for the same message.
+
+Modules:
+    - contextlib: Stands in for the lock when none is shared.
+    - os: Checks the manifest file.
+"""
+
+import contextlib
+import os
+from logger_config import setup_logging
+
+# Configure logging
+logging = setup_logging()
+
+MANIFEST_FILE_NAME = '.manifest'
+
+
+class DownloadManifest:
+    """
+    Append-only set of downloaded message IDs backed by a text file.
+
+    Each line of the file holds one message ID. The file is read once when the
+    manifest is created, which is all a resumed run needs; entries added later
+    by other workers are not read back, since they belong to other shards.
+    Reads and writes of the file are serialized with a lock shared between
+    processes.
+    """
+
+    def __init__(self, base_dir, lock=None):
+        """
+        Args:
+            base_dir (str): Directory of the download; the manifest lives inside it.
+            lock (multiprocessing.Lock, optional): Lock shared between worker processes.
+        """
+        self.path = os.path.join(base_dir, MANIFEST_FILE_NAME)
+        self.lock = lock if lock is not None else contextlib.nullcontext()
+        self._ids = self.__load()
+
+    def __load(self):
+        """
+        Read the message IDs recorded by previous runs.
+
+        Returns:
+            set: The recorded message IDs.
+        """
+        if not os.path.exists(self.path):
+            return set()
+
+        with self.lock:
+            with open(self.path, 'r+b') as file:
+                data = file.read()
+
+                # Drop a trailing fragment left by an interrupted write, so it
+                # is neither read nor extended into a wrong ID by the next add
+                complete = data[:data.rfind(b'\n') + 1]
+                if len(complete) < len(data):
+                    logging.warning("Dropping torn manifest line %r in %s",
+                                    data[len(complete):], self.path)
+                    file.truncate(len(complete))
+
+        ids = set()
+        for line in complete.split():
+            try:
+                ids.add(int(line))
+            except ValueError:
+                logging.warning("Skipping invalid manifest line %r in %s",
+                                line, self.path)
+        return ids
+
+    def contains(self, message_id):
+        """
+        Check whether a message was already downloaded by a previous run.
+
+        Args:
+            message_id (int): The Telegram message ID.
+
+        Returns:
+            bool: True if the message is recorded in the manifest, False otherwise.
+        """
+        return message_id in self._ids
+
+    def add(self, message_id):
+        """
+        Record a downloaded message in the manifest.
+
+        Args:
+            message_id (int): The Telegram message ID.
+        """
+        with self.lock:
+            self.__append(message_id)
+        self._ids.add(message_id)
+
+    def __append(self, message_id):
+        """
+        Write a message ID as a new line at the end of the manifest file.
+
+        Args:
+            message_id (int): The Telegram message ID.
+        """
+        with open(self.path, 'a', encoding="utf-8") as file:
+            file.write(f"{message_id}\n")
@@ -0,0 +1,175 @@
+"""
+Module for downloading media with several Telegram sessions in parallel.
+
+A single session is limited by the bandwidth of one connection and the rate
+limits of one account, and a single event loop becomes CPU-bound at high file
+rates. This module splits the requested date range into disjoint shards of
+consecutive days and downloads each shard in its own worker process with its
+own session file. Since the shards never overlap, no message is downloaded by
+two workers. All workers write into the same base directory and record their
+downloads in a `DownloadManifest`, so an interrupted run can be resumed without
+downloading the same media again.
+
+Sessions are named `group_media_downloader` for the first worker and
+`group_media_downloader-<n>` (n = 2, 3, ...) for the following ones. Workers
+can not prompt for a login, so every session must be authorized beforehand.
+
+Modules:
+    - asyncio: Runs the download of a shard inside a worker process.
+    - concurrent.futures: Manages the worker processes.
+    - multiprocessing: Provides the lock shared by the workers.
+    - downloader: Downloads the media of a shard.
+    - manifest: Records the messages already downloaded.
+
+Functions:
+    - session_names: Names of the sessions used by the workers.
+    - split_date_range: Splits a date range into disjoint shards.
+    - download_media_sharded: Downloads a date range with several workers.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+import downloader
+from file_loader import read_json_config
+from logger_config import setup_logging
+from manifest import DownloadManifest
+from user_input import select_download_mode
+
+# Configure logging
+logging = setup_logging()
+
+
+def session_names(workers):
+    """
+    Build the session names used by the workers.
+
+    Args:
+        workers (int): Number of workers.
+
+    Returns:
+        list: One session name per worker, the first one being the default session.
+    """
+    return [downloader.SESSION_NAME] + [f"{downloader.SESSION_NAME}-{worker}" for worker in range(2, workers + 1)]
+
+
+def split_date_range(start_date_obj, end_date_obj, shards):
+    """
+    Split a date range into disjoint shards of consecutive days.
+
+    The days are spread as evenly as possible; there are never more shards
+    than days in the range.
+
+    Args:
+        start_date_obj (datetime): First day of the range.
+        end_date_obj (datetime): Last day (inclusive) of the range.
+        shards (int): Requested number of shards.
+
+    Returns:
+        list: Tuples (start_date_obj, end_date_obj) of every shard, in order.
+    """
+    total_days = (end_date_obj - start_date_obj).days + 1
+    shards = max(1, min(shards, total_days))
+    size, extra = divmod(total_days, shards)
+
+    ranges = []
+    current_date = start_date_obj
+    for shard in range(shards):
+        days = size + 1 if shard < extra else size
+        shard_end = current_date + timedelta(days=days - 1)
+        ranges.append((current_date, shard_end))
+        current_date = shard_end + timedelta(days=1)
+    return ranges
+
+
+def _run_worker(session_name, group_name, start_date_obj, end_date_obj, base_dir, choose, restrictions, lock, client_factory):
+    """
+    Entry point of a worker process: download one shard with its own session.
+
+    Args:
+        session_name (str): Session file used by the worker.
+        group_name (str): Name of the Telegram group or channel.
+        start_date_obj (datetime): First day of the shard.
+        end_date_obj (datetime): Last day (inclusive) of the shard.
+        base_dir (str): Base directory shared by all shards.
+        choose (int): Download mode (1: General, 2: Group by theme).
+        restrictions (list): Criteria for grouping and filtering messages.
+        lock (multiprocessing.Lock): Lock guarding writes to the manifest file.
+        client_factory (callable): Builds the client of a session name.
+
+    Returns:
+        int: Total number of media files downloaded for the shard.
+    """
+    downloader.client = client_factory(session_name)
+    manifest = DownloadManifest(base_dir, lock)
+    return asyncio.run(downloader.download_shard(group_name, start_date_obj, end_date_obj, base_dir, choose, restrictions, manifest))
+
+
+def download_media_sharded(group_name, start_date_obj, end_date_obj, base_path, workers, choose=None, client_factory=downloader.create_client):
+    """
+    Download all media from a Telegram group within a date range using several workers.
+
+    Args:
+        group_name (str): Name of the Telegram group or channel.
+        start_date_obj (datetime): Start date for media download.
+        end_date_obj (datetime): End date for media download.
+        base_path (str): Directory where media files will be saved.
+        workers (int): Number of worker processes, one session each.
+        choose (int, optional): Download mode (1: General, 2: Group by theme);
+                                the user is prompted if not given.
+        client_factory (callable): Module-level function building the client of a
+                                   session name; a local fake client can be used here.
+
+    Returns:
+        int or None: Total number of media files downloaded, or `None` if the
+                     download could not start.
+    """
+    # Without the current date, a restarted run finds the manifest of the previous one
+    base_dir = downloader.build_base_dir(
+        group_name, start_date_obj, end_date_obj, base_path, with_today=False)
+
+    # Choose type
+    if choose is None:
+        choose = select_download_mode()
+
+    # Load restrictions
+    restrictions = read_json_config("data/restrictions.json", "restrictions")
+    if restrictions is None:
+        print("- Error: No restrictions available.")
+        if choose == 2:
+            return None
+
+    shards = split_date_range(start_date_obj, end_date_obj, workers)
+    sessions = session_names(len(shards))
+    print(f"\nDownloading with {len(shards)} workers...")
+    logging.info("Downloading with %d workers: %s", len(shards), sessions)
+
+    total_downloaded = 0
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        lock = manager.Lock()
+        futures = {
+            executor.submit(_run_worker, session_name, group_name, shard_start, shard_end,
+                            base_dir, choose, restrictions, lock, client_factory): (session_name, shard_start, shard_end)
+            for session_name, (shard_start, shard_end) in zip(sessions, shards)
+        }
+
+        for future in as_completed(futures):
+            session_name, shard_start, shard_end = futures[future]
+            shard_str = f"{shard_start.strftime('%d-%m-%Y')} - {shard_end.strftime('%d-%m-%Y')}"
+            try:
+                shard_count = future.result()
+            except Exception as e:
+                print(f"- Error: Shard {shard_str} ({session_name}): {e}")
+                logging.error("Error in shard %s (%s): %s",
+                              shard_str, session_name, e)
+                continue
+
+            print(f"--- Shard {shard_str} ({session_name}): {shard_count} files")
+            logging.info("--- Downloaded %d files for shard %s (%s).",
+                         shard_count, shard_str, session_name)
+            total_downloaded += shard_count
+
+    print(f"\nTotal media files downloaded: {total_downloaded}")
+    logging.info("Total media files downloaded: %d", total_downloaded)
+    return total_downloaded
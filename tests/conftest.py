@@ -0,0 +1,13 @@
+"""
+Shared test setup.
+
+The modules of the program live in `src` and import each other by name, as
+when running `python src/main.py`, so `src` is added to the import path. Tests
+are run from the root of the repository, where `logging_config.ini` lives.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'src'))
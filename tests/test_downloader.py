@@ -0,0 +1,25 @@
+"""
+Tests for the `downloader` module.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter, where no other test has imported anything yet
+IMPORT_CODE = """
+import sys
+sys.path.insert(0, 'src')
+import downloader
+assert downloader.client is None, 'Telegram client built at import'
+assert 'telethon' not in sys.modules, 'telethon imported at import'
+"""
+
+
+def test_import_is_lazy():
+    result = subprocess.run([sys.executable, '-c', IMPORT_CODE], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
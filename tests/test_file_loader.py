@@ -0,0 +1,25 @@
+"""
+Tests for the `file_loader` module.
+"""
+
+import json
+from file_loader import read_json_config
+
+
+def test_read_json_config_reads_file_once(tmp_path):
+    path = tmp_path / "configs.json"
+    path.write_text(json.dumps({"configs": [{"description": "Family"}]}),
+                    encoding="utf-8")
+
+    assert read_json_config(str(path), "configs") == [
+        {"description": "Family"}]
+
+    path.write_text(json.dumps({"configs": [{"description": "Work"}]}),
+                    encoding="utf-8")
+
+    assert read_json_config(str(path), "configs") == [
+        {"description": "Family"}]
+
+
+def test_read_json_config_missing_file(tmp_path):
+    assert read_json_config(str(tmp_path / "missing.json"), "configs") is None
@@ -0,0 +1,19 @@
+"""
+Tests for the `logger_config` module.
+"""
+
+import logging.config
+import logger_config
+
+
+def test_setup_logging_parses_config_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(logger_config, '__configured', set())
+    monkeypatch.setattr(logging.config, 'fileConfig',
+                        lambda *args, **kwargs: calls.append(args))
+
+    first = logger_config.setup_logging()
+    second = logger_config.setup_logging()
+
+    assert first is second
+    assert len(calls) == 1
@@ -0,0 +1,76 @@
+"""
+Tests for the `manifest` module.
+"""
+
+import multiprocessing
+from manifest import DownloadManifest
+
+
+def test_round_trip(tmp_path):
+    manifest = DownloadManifest(tmp_path)
+    manifest.add(5)
+    manifest.add(7)
+
+    assert manifest.contains(5)
+    assert manifest.contains(7)
+    assert not manifest.contains(9)
+
+    reloaded = DownloadManifest(tmp_path)
+    assert reloaded.contains(5)
+    assert reloaded.contains(7)
+    assert not reloaded.contains(9)
+
+
+def _add_range(base_dir, lock, first_id, count):
+    """
+    Worker process adding `count` consecutive IDs through its own manifest.
+    """
+    manifest = DownloadManifest(base_dir, lock)
+    for message_id in range(first_id, first_id + count):
+        manifest.add(message_id)
+
+
+def test_instances_share_lock_across_processes(tmp_path):
+    with multiprocessing.Manager() as manager:
+        lock = manager.Lock()
+        processes = [multiprocessing.Process(target=_add_range, args=(str(tmp_path), lock, first_id, 200))
+                     for first_id in (1, 1001, 2001)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+    expected = set(range(1, 201)) | set(
+        range(1001, 1201)) | set(range(2001, 2201))
+    with open(DownloadManifest(tmp_path).path, 'r', encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert sorted(int(line) for line in lines) == sorted(expected)
+
+
+def test_drops_partial_trailing_line(tmp_path):
+    manifest = DownloadManifest(tmp_path)
+    manifest.add(1)
+    with open(manifest.path, 'a', encoding="utf-8") as file:
+        file.write("12")
+
+    reloaded = DownloadManifest(tmp_path)
+    assert reloaded.contains(1)
+    assert not reloaded.contains(12)
+
+    # The fragment is dropped, so it neither becomes an entry nor extends the next one
+    reloaded.add(3)
+    after_append = DownloadManifest(tmp_path)
+    assert after_append.contains(1)
+    assert after_append.contains(3)
+    assert not after_append.contains(12)
+    assert not after_append.contains(123)
+
+
+def test_skips_invalid_lines(tmp_path):
+    manifest = DownloadManifest(tmp_path)
+    with open(manifest.path, 'w', encoding="utf-8") as file:
+        file.write("1\nnot-an-id\n2\n")
+
+    reloaded = DownloadManifest(tmp_path)
+    assert reloaded.contains(1)
+    assert reloaded.contains(2)
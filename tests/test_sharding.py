@@ -0,0 +1,116 @@
+"""
+Tests for the `sharding` module, using a local fake Telegram client.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from sharding import download_media_sharded, session_names, split_date_range
+
+START_DATE = datetime(2024, 7, 1)
+END_DATE = datetime(2024, 7, 5)
+MESSAGES_PER_DAY = 2
+
+
+class FakeClient:
+    """
+    Local stand-in for `TelegramClient` serving two photos per day.
+    """
+
+    def __init__(self, session_name):
+        self.session_name = session_name
+        self.messages = []
+        message_id = 1
+        current_date = START_DATE
+        while current_date <= END_DATE:
+            for hour in range(MESSAGES_PER_DAY):
+                date = (current_date + timedelta(hours=hour + 1)
+                        ).replace(tzinfo=timezone.utc)
+                media = SimpleNamespace(photo=True, message_id=message_id)
+                self.messages.append(SimpleNamespace(
+                    id=message_id, date=date, message=None, media=media))
+                message_id += 1
+            current_date += timedelta(days=1)
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def is_user_authorized(self):
+        return True
+
+    async def get_entity(self, group_name):
+        return SimpleNamespace(id=1, title=group_name)
+
+    async def iter_messages(self, entity, offset_date, reverse):
+        for message in self.messages:
+            if message.date.replace(tzinfo=None) >= offset_date:
+                yield message
+
+    async def download_media(self, media, file):
+        path = os.path.join(file, f"{media.message_id}.jpg")
+        with open(path, 'w', encoding="utf-8") as photo:
+            photo.write(self.session_name)
+        return path
+
+
+def fake_client(session_name):
+    """
+    Module-level client factory, so it can be sent to the worker processes.
+    """
+    return FakeClient(session_name)
+
+
+def test_split_date_range_even():
+    shards = split_date_range(datetime(2024, 7, 1), datetime(2024, 7, 6), 3)
+
+    assert shards == [
+        (datetime(2024, 7, 1), datetime(2024, 7, 2)),
+        (datetime(2024, 7, 3), datetime(2024, 7, 4)),
+        (datetime(2024, 7, 5), datetime(2024, 7, 6)),
+    ]
+
+
+def test_split_date_range_uneven():
+    shards = split_date_range(datetime(2024, 7, 1), datetime(2024, 7, 7), 3)
+
+    assert shards == [
+        (datetime(2024, 7, 1), datetime(2024, 7, 3)),
+        (datetime(2024, 7, 4), datetime(2024, 7, 5)),
+        (datetime(2024, 7, 6), datetime(2024, 7, 7)),
+    ]
+
+
+def test_split_date_range_more_workers_than_days():
+    shards = split_date_range(datetime(2024, 7, 1), datetime(2024, 7, 2), 5)
+
+    assert shards == [
+        (datetime(2024, 7, 1), datetime(2024, 7, 1)),
+        (datetime(2024, 7, 2), datetime(2024, 7, 2)),
+    ]
+
+
+def test_session_names():
+    assert session_names(3) == ['group_media_downloader',
+                                'group_media_downloader-2',
+                                'group_media_downloader-3']
+
+
+def test_download_media_sharded(tmp_path):
+    total_days = (END_DATE - START_DATE).days + 1
+
+    total = download_media_sharded('family', START_DATE, END_DATE, str(tmp_path),
+                                   workers=3, choose=1, client_factory=fake_client)
+
+    assert total == total_days * MESSAGES_PER_DAY
+    downloaded = [name for _, _, files in os.walk(tmp_path)
+                  for name in files if name.endswith('.jpg')]
+    assert len(downloaded) == total_days * MESSAGES_PER_DAY
+
+    # A second run resumes from the manifest and downloads nothing
+    total = download_media_sharded('family', START_DATE, END_DATE, str(tmp_path),
+                                   workers=3, choose=1, client_factory=fake_client)
+
+    assert total == 0